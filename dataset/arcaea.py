@@ -0,0 +1,43 @@
+import pandas as pd
+
+from packaging.version import parse as parse_version
+from unidecode import unidecode
+import os
+import re
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'arcaea')
+
+def load_song_data(path: str = DATA_PATH) -> pd.DataFrame:
+    """Load Arcaea song data, shared by the Arcaea page and the query API.
+
+    Args:
+        path (str, optional): Directory containing song_data.csv. Defaults to DATA_PATH.
+
+    Returns:
+        pd.DataFrame: Arcaea song data, sorted by title length.
+    """
+    df = pd.read_csv(os.path.join(path, "song_data.csv"), encoding="utf-8-sig").sort_values(by="Title", key=lambda x: x.str.len())
+    df["Length"] = pd.to_datetime(df['Length'], format='%M:%S', errors='coerce')
+    df["Added_Mobile"] = pd.to_datetime(df["Added_Mobile"], format='%Y-%m-%d')
+    df["Added_Switch"] = pd.to_datetime(df["Added_Switch"], format='%Y-%m-%d')
+    df["Notes_Touch"] = pd.to_numeric(df['Notes_Touch'], errors='coerce').astype('Int64')
+    df["Notes_Joycon"] = pd.to_numeric(df['Notes_Joycon'], errors='coerce').astype('Int64')
+    df["Level"] = pd.to_numeric(df["Level"], errors="coerce").astype('Int64')
+    df["BPM_Max"] = pd.to_numeric(df["BPM_Max"], errors="coerce").astype('Int64')
+    df["BPM_Min"] = pd.to_numeric(df["BPM_Min"], errors="coerce").astype('Int64')
+    df["Chart Constant"] = pd.to_numeric(df["Chart Constant"], errors="coerce").astype('float64')
+    return df
+
+def parse_versions(versions: pd.Series) -> pd.Series:
+    """Parse version strings, with missing versions as "0".
+
+    Args:
+        versions (pd.Series): Version strings.
+
+    Returns:
+        pd.Series: Parsed versions.
+    """
+    return versions.apply(lambda x: parse_version(str(x)) if pd.notna(x) else parse_version("0"))
+
+def title_to_id(raw_id: str) -> str:
+    return re.sub(r'[\W]+', '', unidecode(raw_id).lower())
@@ -8,10 +8,11 @@ import pandas as pd
 import numpy as np
 
 from packaging.version import parse as parse_version
-from unidecode import unidecode
 from datetime import datetime, timedelta
 import os
-import re
+
+from similarity.arcaea import ArcaeaSimilarCharts
+from dataset.arcaea import load_song_data, parse_versions, title_to_id
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'arcaea')
 DIFF_DICT = {
@@ -144,17 +145,7 @@ class ArcaeaSong:
 
 @st.cache_data
 def get_song_data():
-    df = pd.read_csv(os.path.join(DATA_PATH, "song_data.csv"), encoding="utf-8-sig").sort_values(by="Title", key=lambda x: x.str.len())
-    df["Length"] = pd.to_datetime(df['Length'], format='%M:%S', errors='coerce')
-    df["Added_Mobile"] = pd.to_datetime(df["Added_Mobile"], format='%Y-%m-%d')
-    df["Added_Switch"] = pd.to_datetime(df["Added_Mobile"], format='%Y-%m-%d')
-    df["Notes_Touch"] = pd.to_numeric(df['Notes_Touch'], errors='coerce').astype('Int64')
-    df["Notes_Joycon"] = pd.to_numeric(df['Notes_Joycon'], errors='coerce').astype('Int64')
-    df["Level"] = pd.to_numeric(df["Level"], errors="coerce").astype('Int64')
-    df["BPM_Max"] = pd.to_numeric(df["BPM_Max"], errors="coerce").astype('Int64')
-    df["BPM_Min"] = pd.to_numeric(df["BPM_Min"], errors="coerce").astype('Int64')
-    df["Chart Constant"] = pd.to_numeric(df["Chart Constant"], errors="coerce").astype('float64')
-    return df
+    return load_song_data(DATA_PATH)
 
 @st.cache_data
 def get_pack_data():
@@ -164,22 +155,23 @@ def get_pack_data():
 def get_background_data():
     return pd.read_csv(os.path.join(DATA_PATH, "background_data.csv"), encoding="utf-8-sig")
 
+@st.cache_resource
+def get_similar_charts(data: pd.DataFrame) -> ArcaeaSimilarCharts:
+    return ArcaeaSimilarCharts(data)
+
 @st.cache_data
 def get_data_slice(data: pd.DataFrame, cond: pd.Series) -> pd.DataFrame:
     return data.loc[cond]
 
 @st.cache_data
 def parse_get_versions(df: pd.DataFrame, column: str):
-    return df[column].apply(lambda x: parse_version(str(x)) if pd.notna(x) else parse_version("0"))
+    return parse_versions(df[column])
 
 def escape_markdown(_str: str) -> str:
     if pd.isnull(_str):
         return ""
     return _str.translate(str.maketrans({"*": r"\*", "-": r"\-", "_": r"\_", "~": r"\~", "(": r"\(", ")": r"\)", "#": r"\#", "[": r"\[", "]": r"\]"}))
 
-def title_to_id(raw_id: str) -> str:
-    return re.sub(r'[\W]+', '', unidecode(raw_id).lower())
-
 def level_to_str(level: int) -> str:
     if level % 2 == 0:
         return str(level // 2)
@@ -370,6 +362,7 @@ def filter_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 song_data = get_song_data()
 pack_data = get_pack_data()
 background_data = get_background_data()
+similar_charts = get_similar_charts(song_data)
 column_config = {
     "ID": None,
     "Title": st.column_config.TextColumn(width="medium"),
@@ -450,6 +443,25 @@ else:
             
             st.plotly_chart(plotly_fig(song.data, st.session_state.plot_var1, st.session_state.plot_var2), use_container_width=True)
         
+        col1.divider()
+        
+        with col1.container():
+            st.subheader("Similar Charts")
+            
+            notes_column = "Notes_Touch" if st.session_state.song_platform == "Mobile" else "Notes_Joycon"
+            positions, _ = similar_charts.query(song.data.index[0], k=10)
+            similar_data = similar_charts.song_data.iloc[positions].loc[:, ["Image", "Title", "Difficulty", "Level", "Chart Constant", notes_column, "BPM_Min", "BPM_Max", "Length", "Pack"]]
+            similar_data = similar_data.assign(
+                Difficulty=similar_data["Difficulty"].map(difficulty_to_str),
+                Level=similar_data["Level"].map(level_to_str)
+            )
+            st.dataframe(
+                similar_data,
+                column_config=column_config,
+                hide_index=True
+            )
+            st.caption("Ranked by Chart Constant, notes density, BPM range and length.")
+        
     with col2.container():
         st.image(song.artwork_image_url, caption=f"Cover Art by {song.artwork}")
         st.image(song.pack_image_url, caption=f"Pack: {song.pack}")
@@ -0,0 +1,159 @@
+import streamlit as st
+from streamlit_extras.grid import grid
+
+import plotly.graph_objects as go
+import plotly.express as px
+import pandas as pd
+
+import os
+
+SUMMARY_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'arcaea', 'summary')
+DIFF_DICT = {
+    0: "Past",
+    1: "Present",
+    2: "Future",
+    3: "Beyond",
+    4: "Beyond (Moment)",
+    5: "Beyond (Eternity)"
+    }
+
+st.set_page_config(
+    page_title="Arcaea Statistics - Rhythm Ground",
+    page_icon="https://play-lh.googleusercontent.com/6vtKnbt-Rd5y5KIDHUy5adgZAmHBKBMmat0MiRh53qPYr6KqIvgSsYcqAQCsP_CeXXM=s48-rw",
+    layout="wide",
+    menu_items={
+        "Get help": "https://github.com/peunsu/Rhythm-Ground",
+        "Report a Bug": "https://github.com/peunsu/Rhythm-Ground/issues",
+        "About": """
+            ### Rhythm Ground
+            InDev Version.\n
+            Data provided by [Fandom](https://arcaea.fandom.com/).\n
+            Github: https://github.com/peunsu/Rhythm-Ground"""
+    }
+)
+
+@st.cache_data
+def get_summary_data(name: str) -> pd.DataFrame:
+    return pd.read_csv(os.path.join(SUMMARY_PATH, f"{name}.csv"), encoding="utf-8-sig")
+
+def level_to_str(level: int) -> str:
+    if level % 2 == 0:
+        return str(level // 2)
+    else:
+        return str(level // 2) + "+"
+
+def box_fig(data: pd.DataFrame, group: str, title: str) -> go.Figure:
+    fig = go.Figure(go.Box(
+        x=data[group],
+        q1=data["Q1"],
+        median=data["Median"],
+        q3=data["Q3"],
+        lowerfence=data["Min"],
+        upperfence=data["Max"],
+        mean=data["Mean"]
+    ))
+    fig.update_layout(title=title, showlegend=False)
+    return fig
+
+chart_constant_histogram = get_summary_data("chart_constant_histogram")
+chart_constant_quantiles = get_summary_data("chart_constant_quantiles")
+notes_histogram = get_summary_data("notes_histogram")
+notes_quantiles = get_summary_data("notes_quantiles")
+added_by_version = get_summary_data("added_by_version")
+added_by_month = get_summary_data("added_by_month")
+side_difficulty = get_summary_data("side_difficulty")
+side = get_summary_data("side")
+
+with st.sidebar:
+    st.header("Options")
+
+    st.radio("Platform", ["Mobile", "Switch"], key="stats_platform")
+
+st.header("Arcaea Statistics")
+
+total_charts = int(side_difficulty["Charts"].sum())
+cur_grid = grid(3)
+cur_grid.metric(label="Charts", value=total_charts)
+cur_grid.metric(label="Packs", value=len(notes_quantiles))
+cur_grid.metric(label="Levels", value=len(chart_constant_quantiles))
+
+st.divider()
+
+st.subheader("Chart Constant")
+
+level_data = chart_constant_quantiles.assign(Level=chart_constant_quantiles["Level"].map(level_to_str))
+level_histogram = chart_constant_histogram.assign(Level=chart_constant_histogram["Level"].map(level_to_str))
+
+cur_grid = grid(2)
+cur_grid.plotly_chart(box_fig(level_data, "Level", "Chart Constant per <i>Level</i>"), use_container_width=True)
+cur_grid.plotly_chart(px.bar(
+    level_histogram,
+    x="Bin_Start",
+    y="Count",
+    color="Level",
+    title="Chart Constant distribution",
+    labels={"Bin_Start": "Chart Constant"}
+    ), use_container_width=True)
+st.dataframe(level_data, hide_index=True, use_container_width=True)
+
+st.divider()
+
+st.subheader("Notes")
+
+notes_histogram = notes_histogram.assign(Difficulty=notes_histogram["Difficulty"].map(DIFF_DICT))
+
+cur_grid = grid(2)
+cur_grid.plotly_chart(box_fig(notes_quantiles.sort_values(by="Median"), "Pack", "Notes per <i>Pack</i>"), use_container_width=True)
+cur_grid.plotly_chart(px.bar(
+    notes_histogram,
+    x="Bin_Start",
+    y="Count",
+    color="Difficulty",
+    title="Notes distribution",
+    labels={"Bin_Start": "Notes"}
+    ), use_container_width=True)
+st.dataframe(notes_quantiles, hide_index=True, use_container_width=True)
+
+st.divider()
+
+st.subheader("Added Songs")
+
+version_data = added_by_version.loc[added_by_version["Platform"] == st.session_state.stats_platform]
+month_data = added_by_month.loc[added_by_month["Platform"] == st.session_state.stats_platform]
+
+cur_grid = grid(2)
+cur_grid.plotly_chart(px.bar(
+    version_data,
+    x="Version",
+    y=["Songs", "Charts"],
+    barmode="group",
+    title="Added per <i>Version</i>"
+    ).update_xaxes(type="category"), use_container_width=True)
+cur_grid.plotly_chart(px.line(
+    month_data,
+    x="Month",
+    y="Cumulative_Charts",
+    title="Charts over time",
+    markers=True
+    ), use_container_width=True)
+
+st.divider()
+
+st.subheader("Side / Difficulty")
+
+side_data = side_difficulty.assign(Difficulty=side_difficulty["Difficulty"].map(DIFF_DICT))
+
+cur_grid = grid(2)
+cur_grid.plotly_chart(px.bar(
+    side_data,
+    x="Side",
+    y="Charts",
+    color="Difficulty",
+    title="Charts per <i>Side</i> and <i>Difficulty</i>"
+    ), use_container_width=True)
+cur_grid.plotly_chart(px.pie(
+    side,
+    names="Side",
+    values="Songs",
+    title="Songs per <i>Side</i>"
+    ), use_container_width=True)
@@ -11,6 +11,7 @@ import requests
 import re
 import os
 from unidecode import unidecode
+from packaging.version import parse as parse_version
 
 class ArcaeaDataParser():    
     def __init__(self):
@@ -234,9 +235,112 @@ class ArcaeaDataParser():
         
         return self.background_data
 
+    def get_summary_data(self) -> dict:
+        """Get pre-aggregated Arcaea song data summaries as pandas DataFrames.
+
+        Returns:
+            dict: A dict of summary name to pandas DataFrame.
+        """
+        
+        if self.song_data.empty:
+            self.get_song_data()
+        
+        def histogram(df: pd.DataFrame, group: str, column: str, width: float) -> pd.DataFrame:
+            """Count values of a column in fixed-width bins per group.
+
+            Args:
+                df (pd.DataFrame): A pandas DataFrame to aggregate.
+                group (str): Column to group by.
+                column (str): Column to count.
+                width (float): Width of each bin.
+
+            Returns:
+                pd.DataFrame: Bin counts per group, non-empty bins only.
+            """
+            df = df.dropna(subset=[column])
+            bin_start = (np.floor((df[column] / width).round(6)) * width).round(6).rename("Bin_Start")
+            counts = df.groupby([df[group], bin_start]).size().rename("Count").reset_index()
+            counts.insert(2, "Bin_End", (counts["Bin_Start"] + width).round(6))
+            return counts
+        
+        def quantiles(df: pd.DataFrame, group: str, column: str) -> pd.DataFrame:
+            """Get count, mean and five-number summary of a column per group.
+
+            Args:
+                df (pd.DataFrame): A pandas DataFrame to aggregate.
+                group (str): Column to group by.
+                column (str): Column to summarize.
+
+            Returns:
+                pd.DataFrame: Summary statistics per group.
+            """
+            grouped = df.groupby(group)[column]
+            return pd.DataFrame({
+                "Count": grouped.count(),
+                "Mean": grouped.mean(),
+                "Min": grouped.min(),
+                "Q1": grouped.quantile(0.25),
+                "Median": grouped.median(),
+                "Q3": grouped.quantile(0.75),
+                "Max": grouped.max(),
+                "Total": grouped.sum()
+                }).reset_index()
+        
+        def added(df: pd.DataFrame, platform: str, column: str, key=None) -> pd.DataFrame:
+            """Count charts and songs added per value of a column.
+
+            Each song is counted once, at its first value. Charts added to songs
+            released earlier are counted in New_Charts.
+
+            Args:
+                df (pd.DataFrame): A pandas DataFrame to aggregate.
+                platform (str): "Mobile" or "Switch".
+                column (str): Column to group by.
+                key (optional): Sort key for the column. Defaults to None.
+
+            Returns:
+                pd.DataFrame: Charts, new songs, charts for earlier songs and cumulative charts per value.
+            """
+            df = df.dropna(subset=[column]).sort_values(by=column, key=key, kind="stable")
+            first = df.drop_duplicates(subset="ID").set_index("ID")[column]
+            later = df[column].to_numpy() != first.loc[df["ID"]].to_numpy()
+            counts = pd.DataFrame({
+                "Charts": df.groupby(column, sort=False).size(),
+                "Songs": first.value_counts(sort=False),
+                "New_Charts": df.loc[later].groupby(column, sort=False).size()
+                }).fillna(0).astype(int).reset_index().sort_values(by=column, key=key)
+            counts["Cumulative_Charts"] = counts["Charts"].cumsum()
+            counts.insert(0, "Platform", platform)
+            return counts
+        
+        df = self.song_data.copy()
+        df["Level"] = pd.to_numeric(df["Level"], errors="coerce")
+        df["Chart Constant"] = pd.to_numeric(df["Chart Constant"], errors="coerce")
+        df["Notes_Touch"] = pd.to_numeric(df["Notes_Touch"], errors="coerce")
+        
+        version_key = lambda x: x.map(lambda v: parse_version(str(v)))
+        # Charts without a version (e.g. tothefurthestdream on Switch) are left out of both tables
+        month_data = {
+            platform: df.dropna(subset=[f"Version_{platform}"]).assign(Month=lambda x: pd.to_datetime(x[f"Added_{platform}"], format="%Y-%m-%d", errors="coerce").dt.strftime("%Y-%m"))
+            for platform in ["Mobile", "Switch"]
+            }
+        
+        return {
+            "chart_constant_histogram": histogram(df, "Level", "Chart Constant", 0.1),
+            "chart_constant_quantiles": quantiles(df, "Level", "Chart Constant"),
+            "notes_histogram": histogram(df, "Difficulty", "Notes_Touch", 100),
+            "notes_quantiles": quantiles(df, "Pack", "Notes_Touch"),
+            "added_by_version": pd.concat([added(df, platform, f"Version_{platform}", version_key).rename(columns={f"Version_{platform}": "Version"}) for platform in ["Mobile", "Switch"]], ignore_index=True),
+            "added_by_month": pd.concat([added(month_data[platform], platform, "Month") for platform in ["Mobile", "Switch"]], ignore_index=True),
+            "side_difficulty": df.groupby(["Side", "Difficulty"]).agg(Charts=("ID", "size"), Songs=("ID", "nunique")).reset_index(),
+            "side": df.groupby("Side").agg(Charts=("ID", "size"), Songs=("ID", "nunique")).reset_index()
+            }
+
 if __name__ == "__main__":
     arcaea = ArcaeaDataParser()
     DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'arcaea')
     arcaea.get_song_data().to_csv(os.path.join(DATA_PATH, "song_data.csv"), index=False)
+    for name, summary in arcaea.get_summary_data().items():
+        summary.to_csv(os.path.join(DATA_PATH, "summary", f"{name}.csv"), index=False)
     #arcaea.get_pack_data().to_csv(os.path.join(DATA_PATH, "pack_data.csv"), index=False)
     #arcaea.get_background_data().to_csv(os.path.join(DATA_PATH, "background_data.csv"), index=False)
\ No newline at end of file
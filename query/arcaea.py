@@ -0,0 +1,301 @@
+import pandas as pd
+import numpy as np
+
+from packaging.version import parse as parse_version
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import json
+
+from dataset.arcaea import load_song_data, parse_versions, title_to_id
+from similarity.arcaea import ArcaeaSimilarCharts
+
+CATEGORY_COLUMNS = ["Side", "Background", "Pack", "Difficulty"]
+RANGE_COLUMNS = ["Level", "Chart Constant", "Notes_Touch", "Notes_Joycon", "BPM_Min", "BPM_Max"]
+VERSION_COLUMNS = ["Version_Mobile", "Version_Switch"]
+DATE_COLUMNS = ["Added_Mobile", "Added_Switch"]
+PAIR_COLUMNS = RANGE_COLUMNS + VERSION_COLUMNS + ["Length"] + DATE_COLUMNS
+GROUP_COLUMNS = ["Difficulty", "Level", "Pack"]
+VALUE_COLUMNS = {
+    "Chart Constant": "Chart Constant",
+    "Notes": None,
+    "Minimum BPM": "BPM_Min",
+    "Maximum BPM": "BPM_Max",
+    "Length": "Length"
+    }
+
+def to_records(df: pd.DataFrame) -> list:
+    """Transform a pandas DataFrame to JSON-serializable records.
+
+    Args:
+        df (pd.DataFrame): A pandas DataFrame to transform.
+
+    Returns:
+        list: A list of dicts, with lengths as "MM:SS", dates as "YYYY-MM-DD" and missing values as None.
+    """
+    df = df.copy()
+    for column in df.columns:
+        if column == "Length":
+            df[column] = df[column].dt.strftime('%M:%S')
+        elif pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].dt.strftime('%Y-%m-%d')
+    df = df.astype(object).where(df.notna(), None)
+    return [{key: value.item() if isinstance(value, np.generic) else value for key, value in record.items()} for record in df.to_dict("records")]
+
+class MissingParameterError(Exception):
+    """Raised when a required query parameter is missing."""
+
+class ArcaeaQuery():
+    def __init__(self, song_data: pd.DataFrame = None):
+        """Headless queries over Arcaea song data.
+
+        The dataset, parsed versions and similar charts engine are built once and
+        shared by every query.
+
+        Args:
+            song_data (pd.DataFrame, optional): Arcaea song data. Defaults to loading song_data.csv.
+        """
+        self.song_data = load_song_data() if song_data is None else song_data
+        self.versions = {column: parse_versions(self.song_data[column]) for column in VERSION_COLUMNS}
+        self.similar_charts = ArcaeaSimilarCharts(self.song_data)
+
+    def get_song(self, song_id: str) -> pd.DataFrame:
+        """Get every chart of a song.
+
+        Args:
+            song_id (str): ID of the song.
+
+        Returns:
+            pd.DataFrame: Charts of the song, sorted by difficulty.
+        """
+        return self.song_data.loc[self.song_data["ID"] == song_id].sort_values(by="Difficulty")
+
+    def get_chart(self, song_id: str, difficulty: int):
+        """Get the index label of a chart.
+
+        Args:
+            song_id (str): ID of the song.
+            difficulty (int): Difficulty of the chart.
+
+        Raises:
+            KeyError: If the chart does not exist.
+
+        Returns:
+            Index label of the chart in song data.
+        """
+        chart = self.song_data.loc[(self.song_data["ID"] == song_id) & (self.song_data["Difficulty"] == difficulty)]
+        if chart.empty:
+            raise KeyError(f"Chart not found: {song_id} ({difficulty})")
+        return chart.index[0]
+
+    def search_title(self, searchterm: str) -> list:
+        """Search songs by title, same as the searchbox of the Arcaea page.
+
+        Args:
+            searchterm (str): A search term.
+
+        Returns:
+            list: A list of (Title, ID) tuples.
+        """
+        cond = self.song_data["ID"].str.contains(title_to_id(searchterm))
+        return list(self.song_data[cond].loc[:, ["Title", "ID"]].drop_duplicates(subset="Title").itertuples(index=None, name=None))
+
+    def filter(self, filters: dict) -> pd.DataFrame:
+        """Filter song data by columns, same as the filters of the Arcaea page.
+
+        Categorical columns take a list of values, numeric, version, length and date
+        columns take a (min, max) pair, and any other column takes a substring.
+
+        Args:
+            filters (dict): A dict of column to filter value.
+
+        Raises:
+            KeyError: If a column does not exist.
+            ValueError: If a filter value is malformed.
+
+        Returns:
+            pd.DataFrame: Filtered song data.
+        """
+        df = self.song_data
+        cond = np.full(len(df), True)
+
+        for column, value in filters.items():
+            if column not in df.columns or column in ["ID", "Image"]:
+                raise KeyError(f"Unknown column: {column}")
+            if column in CATEGORY_COLUMNS:
+                values = list(value)
+                if column == "Difficulty":
+                    try:
+                        values = [int(x) for x in values]
+                    except (TypeError, ValueError):
+                        raise ValueError(f"Invalid value for {column}") from None
+                cond &= df[column].isin(values)
+            elif column in PAIR_COLUMNS:
+                if isinstance(value, str) or len(value) != 2:
+                    raise ValueError(f"Expected (min, max) for {column}")
+                try:
+                    if column in VERSION_COLUMNS:
+                        bounds = [parse_version(str(x)) for x in value]
+                    elif column == "Length":
+                        bounds = [pd.to_datetime(x, format='%M:%S') for x in value]
+                    elif column in DATE_COLUMNS:
+                        bounds = [pd.to_datetime(x, format='%Y-%m-%d') for x in value]
+                    else:
+                        bounds = [float(x) for x in value]
+                except (TypeError, ValueError):
+                    raise ValueError(f"Invalid value for {column}") from None
+                in_range = (self.versions[column] if column in VERSION_COLUMNS else df[column]).between(*bounds)
+                # Nullable Int64 columns give <NA> for missing values, which never match
+                cond &= in_range.fillna(False).to_numpy(dtype=bool)
+            elif not isinstance(value, str):
+                raise ValueError(f"Expected a single substring for {column}")
+            elif value:
+                cond &= df[column].astype(str).str.lower().str.contains(str(value).lower(), regex=False)
+
+        return df.loc[cond]
+
+    def ranking(self, song_id: str, difficulty: int, group: str, value: str, platform: str = "Mobile") -> dict:
+        """Rank a chart within its group, same as the Compare plot of the Arcaea page.
+
+        Args:
+            song_id (str): ID of the song.
+            difficulty (int): Difficulty of the chart.
+            group (str): Column to group by. One of "Difficulty", "Level" or "Pack".
+            value (str): Value to rank by. One of "Chart Constant", "Notes", "Minimum BPM", "Maximum BPM" or "Length".
+            platform (str, optional): "Mobile" or "Switch". Defaults to "Mobile".
+
+        Raises:
+            KeyError: If the chart, group or value does not exist.
+
+        Returns:
+            dict: Rank and top percentile of the chart, and the ranking of its group.
+        """
+        if group not in GROUP_COLUMNS:
+            raise KeyError(f"Unknown group: {group}")
+        if value not in VALUE_COLUMNS:
+            raise KeyError(f"Unknown value: {value}")
+        col = VALUE_COLUMNS[value] or ("Notes_Touch" if platform == "Mobile" else "Notes_Joycon")
+
+        label = self.get_chart(song_id, difficulty)
+        cur_data = self.song_data.loc[label]
+        chart_data = self.song_data.loc[self.song_data[group] == cur_data[group]].sort_values(by=col, ascending=False).reset_index()
+        cur_index = int(chart_data.index[chart_data["index"] == label][0])
+        entries = int(chart_data[col].notna().sum())
+
+        return {
+            "group": group,
+            "value": value,
+            "rank": cur_index,
+            "entries": entries,
+            "top_percentile": cur_index * 100 / entries if entries else None,
+            "ranking": to_records(chart_data.loc[:, ["ID", "Title", "Difficulty", col]])
+            }
+
+    def similar(self, song_id: str, difficulty: int, k: int = 10) -> pd.DataFrame:
+        """Get the charts most similar to a chart.
+
+        Args:
+            song_id (str): ID of the song.
+            difficulty (int): Difficulty of the chart.
+            k (int, optional): Number of similar charts. Defaults to 10.
+
+        Returns:
+            pd.DataFrame: Similar charts, closest first, with a "Distance" column.
+        """
+        positions, distances = self.similar_charts.query(self.get_chart(song_id, difficulty), k=k)
+        return self.song_data.iloc[positions].assign(Distance=distances)
+
+class ArcaeaQueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: tuple, query: ArcaeaQuery = None, cache_size: int = 4096):
+        """Local HTTP/JSON server over a shared ArcaeaQuery.
+
+        Responses are cached by path and query string, so repeated requests skip
+        pandas entirely.
+
+        Args:
+            address (tuple): (host, port) to bind.
+            query (ArcaeaQuery, optional): Shared query object. Defaults to loading song_data.csv.
+            cache_size (int, optional): Maximum number of cached responses. Defaults to 4096.
+        """
+        super().__init__(address, ArcaeaQueryHandler)
+        self.query = ArcaeaQuery() if query is None else query
+        self.respond = lru_cache(maxsize=cache_size)(self._respond)
+
+    def _respond(self, path: str, query_string: str) -> tuple:
+        """Build a JSON response.
+
+        Args:
+            path (str): Request path.
+            query_string (str): Request query string.
+
+        Returns:
+            tuple: HTTP status code and response body in bytes.
+        """
+        params = parse_qs(query_string, keep_blank_values=True)
+
+        def param(name: str, default=None, type=str):
+            if name in params:
+                value = params[name][0]
+            elif default is None:
+                raise MissingParameterError(f"Missing parameter: {name}")
+            else:
+                value = default
+            try:
+                return type(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {name}") from None
+
+        try:
+            if path == "/search":
+                payload = [{"Title": title, "ID": song_id} for title, song_id in self.query.search_title(param("q"))]
+            elif path.startswith("/songs/"):
+                payload = to_records(self.query.get_song(path[len("/songs/"):]))
+                if not payload:
+                    return 404, json.dumps({"error": "Song not found"}).encode()
+            elif path == "/filter":
+                filters = {}
+                for column, values in params.items():
+                    if column in CATEGORY_COLUMNS + PAIR_COLUMNS or len(values) > 1:
+                        filters[column] = values
+                    else:
+                        filters[column] = values[0]
+                payload = to_records(self.query.filter(filters))
+            elif path == "/ranking":
+                payload = self.query.ranking(param("id"), param("difficulty", type=int), param("group"), param("value"), param("platform", "Mobile"))
+            elif path == "/similar":
+                payload = to_records(self.query.similar(param("id"), param("difficulty", type=int), param("k", 10, type=int)))
+            else:
+                return 404, json.dumps({"error": "Not found"}).encode()
+        except KeyError as e:
+            return 400, json.dumps({"error": e.args[0]}).encode()
+        except (MissingParameterError, ValueError) as e:
+            return 400, json.dumps({"error": str(e)}).encode()
+
+        return 200, json.dumps(payload, ensure_ascii=False).encode()
+
+class ArcaeaQueryHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, body = self.server.respond(url.path, url.query)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Arcaea song data as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+
+    server = ArcaeaQueryServer((args.host, args.port))
+    print(f"Serving Arcaea query API on http://{args.host}:{args.port}")
+    server.serve_forever()
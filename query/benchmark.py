@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from urllib.request import urlopen
+from urllib.error import HTTPError
+import argparse
+import threading
+import random
+import time
+
+from query.arcaea import ArcaeaQuery, ArcaeaQueryServer
+
+def build_paths(query: ArcaeaQuery, count: int, seed: int = 0) -> list:
+    """Build a mix of request paths over the dataset.
+
+    Args:
+        query (ArcaeaQuery): Query object to draw songs and charts from.
+        count (int): Number of paths to draw.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list: Distinct request paths with query strings.
+    """
+    rng = random.Random(seed)
+    charts = list(query.song_data.loc[:, ["ID", "Title", "Difficulty", "Pack"]].itertuples(index=None, name=None))
+    paths = []
+    for _ in range(count):
+        song_id, title, difficulty, pack = rng.choice(charts)
+        kind = rng.choice(["search", "song", "filter", "ranking", "similar"])
+        if kind == "search":
+            paths.append("/search?" + urlencode({"q": title[:rng.randint(1, max(1, len(title)))]}))
+        elif kind == "song":
+            paths.append(f"/songs/{song_id}")
+        elif kind == "filter":
+            paths.append("/filter?" + urlencode([("Pack", pack), ("Level", 2 * rng.randint(1, 6)), ("Level", 2 * rng.randint(6, 12))]))
+        elif kind == "ranking":
+            paths.append("/ranking?" + urlencode({"id": song_id, "difficulty": difficulty, "group": rng.choice(["Difficulty", "Level", "Pack"]), "value": rng.choice(["Chart Constant", "Notes", "Minimum BPM", "Maximum BPM", "Length"])}))
+        else:
+            paths.append("/similar?" + urlencode({"id": song_id, "difficulty": difficulty}))
+    return list(dict.fromkeys(paths))
+
+def run(base_url: str, paths: list, requests: int, concurrency: int) -> list:
+    """Send requests from concurrent workers and record latencies.
+
+    Args:
+        base_url (str): Server URL.
+        paths (list): Request paths to cycle through.
+        requests (int): Total number of requests.
+        concurrency (int): Number of concurrent workers.
+
+    Returns:
+        list: Latency of each request in seconds.
+    """
+    def fetch(i: int) -> float:
+        start = time.perf_counter()
+        try:
+            with urlopen(base_url + paths[i % len(paths)]) as response:
+                response.read()
+        except HTTPError as e:
+            e.read()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(fetch, range(requests)))
+
+def report(label: str, latencies: list, elapsed: float):
+    latencies = sorted(latencies)
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    print(f"{label: <6} {len(latencies) / elapsed: >9.1f} req/s | p50 {percentile(0.50): >7.2f} ms | p95 {percentile(0.95): >7.2f} ms | p99 {percentile(0.99): >7.2f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Arcaea query API with a local load generator.")
+    parser.add_argument("--url", default=None, help="Benchmark a running server instead of starting one.")
+    parser.add_argument("--requests", type=int, default=5000, help="Number of requests in the warm pass.")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--paths", type=int, default=500, help="Number of request paths to draw.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for request paths.")
+    args = parser.parse_args()
+
+    query = ArcaeaQuery()
+    paths = build_paths(query, args.paths, args.seed)
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = ArcaeaQueryServer(("127.0.0.1", 0), query=query)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    else:
+        print("Cold pass assumes the server has not cached these paths yet; use a new --seed to draw others.")
+
+    # Cold pass sends each distinct path once, so every request misses the response cache
+    start = time.perf_counter()
+    latencies = run(base_url, paths, len(paths), args.concurrency)
+    report("cold", latencies, time.perf_counter() - start)
+
+    # Warm pass only repeats paths the cold pass already cached
+    start = time.perf_counter()
+    latencies = run(base_url, paths, args.requests, args.concurrency)
+    report("warm", latencies, time.perf_counter() - start)
+
+    if server is not None:
+        server.shutdown()
@@ -0,0 +1,147 @@
+import pandas as pd
+import numpy as np
+import os
+
+FEATURE_COLUMNS = ["Chart Constant", "Notes Density", "BPM_Min", "BPM_Max", "Length"]
+
+def length_to_seconds(length: pd.Series) -> pd.Series:
+    """Transform chart length to seconds.
+
+    Args:
+        length (pd.Series): Chart length, either parsed datetime or raw "M:SS" string.
+
+    Returns:
+        pd.Series: Chart length in seconds.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(length):
+        length = pd.to_datetime(length, format='%M:%S', errors='coerce')
+    return (length - length.dt.normalize()).dt.total_seconds()
+
+class ArcaeaSimilarCharts():
+    def __init__(self, song_data: pd.DataFrame):
+        """Nearest-neighbour search over Arcaea charts.
+
+        The normalized feature matrix is built once here, so each lookup is a
+        single vectorized distance computation over every chart.
+
+        Args:
+            song_data (pd.DataFrame): Arcaea song data, one row per chart.
+        """
+        self.song_data = song_data
+        self.index = song_data.index
+        self.ids = song_data["ID"].to_numpy()
+        self.features = self.build_features(song_data)
+        self.matrix = self.normalize(self.features)
+
+    def build_features(self, song_data: pd.DataFrame) -> pd.DataFrame:
+        """Build raw chart features from song data.
+
+        Args:
+            song_data (pd.DataFrame): Arcaea song data.
+
+        Returns:
+            pd.DataFrame: Chart Constant, notes density (notes per second), BPM range and length in seconds.
+        """
+        length = length_to_seconds(song_data["Length"])
+        notes = pd.to_numeric(song_data["Notes_Touch"], errors="coerce").astype("float64")
+        features = pd.DataFrame({
+            "Chart Constant": pd.to_numeric(song_data["Chart Constant"], errors="coerce").astype("float64"),
+            "Notes Density": notes / length.where(length > 0),
+            "BPM_Min": pd.to_numeric(song_data["BPM_Min"], errors="coerce").astype("float64"),
+            "BPM_Max": pd.to_numeric(song_data["BPM_Max"], errors="coerce").astype("float64"),
+            "Length": length
+            }, index=song_data.index)
+        return features[FEATURE_COLUMNS]
+
+    def normalize(self, features: pd.DataFrame) -> np.ndarray:
+        """Standardize each feature to zero mean and unit variance.
+
+        Missing values are set to the mean, so they do not pull charts apart.
+
+        Args:
+            features (pd.DataFrame): Raw chart features.
+
+        Returns:
+            np.ndarray: Normalized feature matrix of shape (charts, features).
+        """
+        std = features.std().replace(0, 1).fillna(1)
+        return ((features - features.mean()) / std).fillna(0).to_numpy(dtype="float64")
+
+    def distances(self, position: int) -> np.ndarray:
+        """Compute distances from one chart to every chart.
+
+        Args:
+            position (int): Row position of the chart in the feature matrix.
+
+        Returns:
+            np.ndarray: Euclidean distances, with charts of the same song set to infinity.
+        """
+        diff = self.matrix - self.matrix[position]
+        dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+        dist[self.ids == self.ids[position]] = np.inf
+        return dist
+
+    def top_k(self, dist: np.ndarray, k: int) -> np.ndarray:
+        """Get positions of the k smallest finite distances in ascending order.
+
+        Ties are broken by row position, so equal distances always come out in
+        the same order.
+
+        Args:
+            dist (np.ndarray): Distances to every chart.
+            k (int): Number of neighbours.
+
+        Returns:
+            np.ndarray: Row positions of the nearest charts.
+        """
+        k = min(k, int(np.isfinite(dist).sum()))
+        if k <= 0:
+            return np.array([], dtype=int)
+        kth = np.partition(dist, k - 1)[k - 1]
+        nearest = np.flatnonzero(dist <= kth)
+        return nearest[np.lexsort((nearest, dist[nearest]))][:k]
+
+    def query(self, label, k: int = 10) -> tuple:
+        """Get the charts most similar to the given chart.
+
+        Args:
+            label: Index label of the chart in song data.
+            k (int, optional): Number of similar charts. Defaults to 10.
+
+        Returns:
+            tuple: Row positions of the similar charts in song data, closest first, and their distances.
+        """
+        dist = self.distances(self.index.get_loc(label))
+        nearest = self.top_k(dist, k)
+        return nearest, dist[nearest]
+
+    def query_all(self, k: int = 10) -> pd.DataFrame:
+        """Get the top-k similar charts for every chart.
+
+        Each chart goes through the same distance computation as query, so the
+        export agrees with single lookups.
+
+        Args:
+            k (int, optional): Number of similar charts per chart. Defaults to 10.
+
+        Returns:
+            pd.DataFrame: One row per (chart, neighbour) pair.
+        """
+        records = []
+        titles = self.song_data["Title"].to_numpy()
+        difficulties = self.song_data["Difficulty"].to_numpy()
+
+        for position in range(len(self.matrix)):
+            dist = self.distances(position)
+            for rank, nearest in enumerate(self.top_k(dist, k), start=1):
+                records.append((
+                    self.ids[position], titles[position], difficulties[position], rank,
+                    self.ids[nearest], titles[nearest], difficulties[nearest], dist[nearest]
+                    ))
+
+        return pd.DataFrame(records, columns=["ID", "Title", "Difficulty", "Rank", "Similar_ID", "Similar_Title", "Similar_Difficulty", "Distance"])
+
+if __name__ == "__main__":
+    DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'arcaea')
+    song_data = pd.read_csv(os.path.join(DATA_PATH, "song_data.csv"), encoding="utf-8-sig")
+    ArcaeaSimilarCharts(song_data).query_all().to_csv(os.path.join(DATA_PATH, "similar_charts.csv"), index=False)